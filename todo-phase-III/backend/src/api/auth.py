@@ -13,7 +13,7 @@ from api.models import (
 )
 from middleware.auth_middleware import get_current_user_id
 from models.user import User
-from utils.rate_limiter import auth_rate_limiter, get_client_ip, get_rate_limit_key
+from utils.rate_limiter import auth_rate_limiter, rate_limiter, get_client_ip, get_rate_limit_key
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -109,8 +109,8 @@ def login(request: Request, user_data: UserLoginRequest, db_session: Session = D
 
         # Still rate limit even on failed login attempts
         # Update rate limit counter
-        auth_rate_limiter.login_attempts_limiter.is_allowed(
-            rate_limit_key,
+        rate_limiter.is_allowed(
+            f"login:{rate_limit_key}",
             auth_rate_limiter.LOGIN_ATTEMPTS_LIMIT,
             auth_rate_limiter.LOGIN_WINDOW_SIZE
         )
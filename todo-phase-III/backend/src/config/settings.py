@@ -17,6 +17,11 @@ class Settings(BaseSettings):
 
     # Database settings
     database_url: str
+    # Pool sized to worker concurrency rather than the SQLAlchemy default
+    # of 5: with ~100 concurrent authenticated requests, a 5-connection
+    # pool becomes the serialization point.
+    db_pool_size: int = 25
+    db_max_overflow: int = 25
 
     # Application settings
     environment: str = "development"
@@ -40,5 +45,17 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+def build_settings() -> Settings:
+    """
+    Construct a fresh Settings instance from the current environment.
+
+    Pydantic reads the environment at instantiation time, so callers (and
+    tests) that need to observe changed env vars can call this instead of
+    importlib.reload-ing the module — a reload re-executes the whole
+    module and re-registers every validator.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = build_settings()
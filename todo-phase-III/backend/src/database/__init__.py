@@ -1,4 +1,5 @@
 # Database package
 from database.connection import get_session, engine, init_db
+from database.rls import enable_row_level_security, set_session_user
 
-__all__ = ["get_session", "engine", "init_db"]
+__all__ = ["get_session", "engine", "init_db", "enable_row_level_security", "set_session_user"]
@@ -5,10 +5,12 @@ Provides SQLAlchemy engine with serverless-optimized connection pooling
 and session management for FastAPI dependency injection.
 """
 
+from fastapi import Request
 from sqlmodel import Session, SQLModel, create_engine
 from typing import Generator
 
 from config.settings import settings
+from database.rls import set_session_user
 
 
 # Validate DATABASE_URL is set
@@ -24,10 +26,10 @@ engine = create_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL queries in development
     pool_pre_ping=True,  # Verify connection health before use
-    pool_size=5,  # Small pool for serverless (Neon has connection limits)
-    max_overflow=10,  # Allow burst connections under load
+    pool_size=settings.db_pool_size,  # Sized to worker concurrency, env-overridable
+    max_overflow=settings.db_max_overflow,  # Allow burst connections under load
     pool_timeout=30,  # Wait up to 30 seconds for available connection
-    pool_recycle=3600,  # Recycle connections after 1 hour (Neon best practice)
+    pool_recycle=1800,  # Recycle connections after 30 minutes
 )
 
 
@@ -45,13 +47,22 @@ def init_db() -> None:
     SQLModel.metadata.create_all(engine)
 
 
-def get_session() -> Generator[Session, None, None]:
+# The annotation must be bare Request for FastAPI to inject it; the None
+# default keeps direct (non-request) callers working.
+def get_session(request: Request = None) -> Generator[Session, None, None]:
     """
     Dependency for FastAPI to inject database sessions.
 
     Yields a SQLModel Session that is automatically closed after use.
     Use with FastAPI's Depends() for automatic session management.
 
+    When the request was authenticated (JWTAuthMiddleware put user_id on
+    request.state), the user is bound to every transaction the session
+    opens so the PostgreSQL row-level-security policies see it — routes
+    commit mid-request, so a single SET LOCAL would not survive to the
+    reads that follow. Public routes and direct callers outside a request
+    skip the binding.
+
     Usage in FastAPI route:
         @app.get("/items")
         def get_items(session: Session = Depends(get_session)):
@@ -62,4 +73,7 @@ def get_session() -> Generator[Session, None, None]:
         Session: SQLModel database session
     """
     with Session(engine) as session:
+        user_id = getattr(request.state, "user_id", None) if request is not None else None
+        if user_id is not None:
+            set_session_user(session, user_id)
         yield session
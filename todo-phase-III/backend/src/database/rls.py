@@ -0,0 +1,77 @@
+"""
+PostgreSQL Row-Level Security (RLS) for user isolation.
+
+The service layer already scopes every query by user_id; RLS adds the same
+predicate inside the database, so isolation holds even if a query path
+forgets to filter (defense in depth). Policies read the requesting user
+from the `app.user_id` session GUC, which must be set per transaction via
+set_session_user().
+
+RLS is PostgreSQL-only. On other dialects (e.g. the SQLite test database)
+these helpers are no-ops and the application-layer filters remain the sole
+enforcement, so nothing here may replace the service-layer scoping.
+"""
+
+import logging
+
+from sqlalchemy import event, text
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+# Tables that carry a user_id ownership column and get an isolation policy
+_RLS_TABLES = ("task",)
+
+# FORCE makes the policy apply to the table owner too — the app typically
+# connects as the owning role, and without FORCE the policy would be inert
+# for it.
+_POLICY_DDL = """
+ALTER TABLE {table} ENABLE ROW LEVEL SECURITY;
+ALTER TABLE {table} FORCE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS user_isolation ON {table};
+CREATE POLICY user_isolation ON {table}
+    USING (user_id = current_setting('app.user_id', true)::int);
+"""
+
+
+def enable_row_level_security() -> None:
+    """
+    Apply isolation policies to all user-owned tables.
+
+    Idempotent; intended to run right after init_db(). Does nothing when
+    the engine is not PostgreSQL.
+    """
+    # Imported here: connection.py imports set_session_user from this
+    # module, so a top-level import would be circular.
+    from database.connection import engine
+
+    if engine.dialect.name != "postgresql":
+        logger.debug("RLS skipped: dialect %s has no row-level security", engine.dialect.name)
+        return
+
+    with engine.begin() as connection:
+        for table in _RLS_TABLES:
+            connection.execute(text(_POLICY_DDL.format(table=table)))
+    logger.info("Row-level security enabled on: %s", ", ".join(_RLS_TABLES))
+
+
+def set_session_user(session: Session, user_id: int) -> None:
+    """
+    Bind the requesting user to every transaction of this session.
+
+    SET LOCAL evaporates when a transaction ends, and routes commit
+    mid-request (e.g. create_task commits and then refreshes the new row),
+    so a one-shot SET LOCAL would leave the follow-up transaction without
+    the GUC and the policies would hide the user's own rows. An after_begin
+    listener re-issues the SET LOCAL at the start of each transaction the
+    session opens, and SET LOCAL still guarantees the setting cannot leak
+    across transactions on a pooled connection.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    # GUC names cannot be bound parameters; user_id is validated as int
+    statement = text(f"SET LOCAL app.user_id = {int(user_id)}")
+
+    @event.listens_for(session, "after_begin")
+    def _bind_user(_session, _transaction, connection):
+        connection.execute(statement)
@@ -1,14 +1,56 @@
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from datetime import timedelta
+from typing import Optional, Dict, Any, Tuple
+import base64
+import hashlib
+import hmac
 import os
-import bcrypt
-from jose import JWTError, jwt
+import threading
+import time
 
-# Get JWT secret from environment or use default
-SECRET_KEY = os.getenv("BETTER_AUTH_SECRET", "your-32-character-secret-key-here")
+import bcrypt
+import jwt
+import orjson
+from cachetools import TTLCache
+
+# Get JWT secret from environment or use default. Pre-encoded to bytes once:
+# passing a str makes every encode/decode re-run the str→bytes conversion on
+# the HMAC hot path.
+SECRET_KEY_BYTES = os.getenv("BETTER_AUTH_SECRET", "your-32-character-secret-key-here").encode("utf-8")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRATION_DELTA", 1440))  # 24 hours
 
+# Bounded cache of successful verifications. The same bearer token arrives on
+# every request of a session, so caching the decoded payload skips the HMAC +
+# JSON work for repeats. Keyed by a blake2b digest of the token rather than
+# the token itself; failures are never cached.
+JWT_CACHE_TTL = int(os.getenv("JWT_CACHE_TTL", 30))  # seconds
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", 10000))
+
+# bcrypt work factor. Cost doubles per round: 12 (~250ms/hash) for
+# production, overridable so the test suite can drop to 4 and not spend
+# seconds hashing throwaway passwords.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+_token_cache: TTLCache = TTLCache(maxsize=JWT_CACHE_SIZE, ttl=JWT_CACHE_TTL)
+_token_cache_lock = threading.Lock()
+
+# Pre-keyed HMAC context. The HMAC key schedule (two SHA-256 setup blocks)
+# only depends on the secret, so it is computed once here and .copy()'d per
+# verification instead of re-run by hmac.new on every call.
+_HMAC_PROTOTYPE = hmac.new(SECRET_KEY_BYTES, digestmod=hashlib.sha256)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_hs256(signing_input: str, signature_b64: str) -> bool:
+    """Check the HS256 signature over header.payload in constant time."""
+    h = _HMAC_PROTOTYPE.copy()
+    h.update(signing_input.encode("ascii"))
+    return hmac.compare_digest(h.digest(), _b64url_decode(signature_b64))
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -39,7 +81,7 @@ def get_password_hash(password: str) -> str:
     """
     return bcrypt.hashpw(
         password.encode("utf-8"),
-        bcrypt.gensalt(),
+        bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
     ).decode("utf-8")
 
 
@@ -55,40 +97,119 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         Encoded JWT token string
     """
     to_encode = data.copy()
+    # Integer epoch timestamps: PyJWT would convert datetimes to these
+    # anyway, and time.time() skips two datetime allocations per token.
+    now_ts = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now_ts + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now_ts + ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": expire, "iat": now_ts})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[Dict[str, Any]]:
+def _normalize_user_id(payload: Dict[str, Any]) -> Optional[int]:
+    """Pull the user id out of the claims, coercing "42"-style strings."""
+    user_id = payload.get("user_id") or payload.get("sub")
+    if isinstance(user_id, str):
+        try:
+            user_id = int(user_id)
+        except ValueError:
+            return None
+    return user_id
+
+
+def verify_token_fast(token: str) -> Optional[Tuple[Optional[int], Any, Dict[str, Any]]]:
     """
-    Verify a JWT token and return its claims if valid.
+    Verify a JWT token, returning ``(user_id, exp, payload)`` if valid.
+
+    This is the middleware entry point: the caller usually only needs the
+    integer user id, so it is normalized once here (at cache-insert time)
+    instead of per request on every cache hit.
 
     Args:
         token: JWT token string to verify
 
     Returns:
-        Dictionary containing token claims if valid, None otherwise
+        Tuple of (user_id, exp timestamp, claims dict) if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    # Structural fast path: a compact JWS is exactly three non-empty
+    # dot-separated segments. Garbage tokens (probe traffic, truncation)
+    # bail out here without paying for hashing or HMAC.
+    parts = token.split(".", 3)
+    if len(parts) != 3 or not all(parts):
+        return None
 
-        # Check if token is expired
-        exp_timestamp = payload.get("exp")
-        if exp_timestamp:
-            exp_datetime = datetime.utcfromtimestamp(exp_timestamp)
-            if datetime.utcnow() > exp_datetime:
-                return None  # Token is expired
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
 
-        return payload
-    except JWTError:
+    with _token_cache_lock:
+        entry = _token_cache.get(cache_key)
+    if entry is not None:
+        # The cached entry may outlive the token — re-check exp on every hit
+        exp_timestamp = entry[1]
+        if exp_timestamp and time.time() > exp_timestamp:
+            with _token_cache_lock:
+                _token_cache.pop(cache_key, None)
+            return None
+        return entry
+
+    if ALGORITHM == "HS256":
+        try:
+            # Bespoke hot path: reject any header that doesn't declare the
+            # expected algorithm, then signature (HMAC copy + compare),
+            # then one JSON parse of the payload. PyJWT is bypassed here.
+            header = orjson.loads(_b64url_decode(parts[0]))
+            if not isinstance(header, dict) or header.get("alg") != "HS256":
+                return None
+            if not _verify_hs256(f"{parts[0]}.{parts[1]}", parts[2]):
+                return None
+            payload = orjson.loads(_b64url_decode(parts[1]))
+        except (ValueError, UnicodeEncodeError):
+            return None
+    else:
+        # Non-default JWT_ALGORITHM: the bespoke verifier only speaks
+        # HS256, so take the generic PyJWT path — slower, but tokens the
+        # app itself issued stay verifiable.
+        try:
+            payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=[ALGORITHM])
+        except jwt.PyJWTError:
+            return None
+
+    if not isinstance(payload, dict):
         return None
 
+    # Check if token is expired — plain float comparison, no datetime
+    # objects. A signed token can still carry a malformed exp (e.g. a
+    # string); treat that as invalid rather than letting the comparison
+    # raise TypeError out of the middleware.
+    exp_timestamp = payload.get("exp")
+    if exp_timestamp is not None:
+        if not isinstance(exp_timestamp, (int, float)):
+            return None
+        if time.time() > exp_timestamp:
+            return None  # Token is expired
+
+    entry = (_normalize_user_id(payload), exp_timestamp, payload)
+    with _token_cache_lock:
+        _token_cache[cache_key] = entry
+    return entry
+
+
+def verify_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify a JWT token and return its claims if valid.
+
+    Args:
+        token: JWT token string to verify
+
+    Returns:
+        Dictionary containing token claims if valid, None otherwise
+    """
+    entry = verify_token_fast(token)
+    return entry[2] if entry is not None else None
+
 
 def decode_token_payload(token: str) -> Optional[Dict[str, Any]]:
     """
@@ -103,9 +224,9 @@ def decode_token_payload(token: str) -> Optional[Dict[str, Any]]:
     """
     try:
         # This decodes without verification - use only for non-sensitive operations
-        payload = jwt.get_unverified_claims(token)
+        payload = jwt.decode(token, options={"verify_signature": False})
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -120,11 +241,10 @@ def is_token_expired(payload: Dict[str, Any]) -> bool:
         True if token is expired, False otherwise
     """
     exp_timestamp = payload.get("exp")
-    if not exp_timestamp:
-        return True
+    if not isinstance(exp_timestamp, (int, float)):
+        return True  # missing or malformed exp counts as expired
 
-    exp_datetime = datetime.utcfromtimestamp(exp_timestamp)
-    return datetime.utcnow() > exp_datetime
+    return time.time() > exp_timestamp
 
 
 def get_user_id_from_token(token: str) -> Optional[int]:
@@ -137,18 +257,9 @@ def get_user_id_from_token(token: str) -> Optional[int]:
     Returns:
         User ID if present and token is valid, None otherwise
     """
-    payload = verify_token(token)
-    if not payload:
-        return None
-
-    user_id = payload.get("sub")
-    if not user_id:
-        user_id = payload.get("user_id")
-
-    if isinstance(user_id, str):
-        try:
-            user_id = int(user_id)
-        except ValueError:
-            return None
-
-    return user_id
\ No newline at end of file
+    # Goes through the same verification cache as the middleware, so a
+    # token seen on a request earlier in the TTL window costs one dict
+    # lookup here, not a second HMAC — and the user id was already
+    # normalized at cache-insert time.
+    entry = verify_token_fast(token)
+    return entry[0] if entry is not None else None
\ No newline at end of file
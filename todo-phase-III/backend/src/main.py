@@ -1,44 +1,63 @@
 from datetime import datetime
+from functools import lru_cache
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from middleware.security import SecurityHeadersMiddleware
 from middleware.auth_middleware import JWTAuthMiddleware
+from middleware.health import FastHealthMiddleware
 from api.auth import router as auth_router
 from api.tasks import router as tasks_router
 from config.auth_config import validate_startup_configuration
-from database import init_db
+from database import init_db, enable_row_level_security
+import logging
 import os
 import sys
 import time
 
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+log = logging.getLogger("taskpulse.startup")
+
 
-def create_app() -> FastAPI:
+def create_app(validate: bool = True, init_database: bool = True) -> FastAPI:
     """
     Create and configure the FastAPI application.
 
+    Args:
+        validate: Run startup configuration validation (disable in tests)
+        init_database: Sync the database schema on startup (disable in tests)
+
     Returns:
         Configured FastAPI application instance
     """
     # Validate startup configuration before creating the app
     try:
-        print("Validating startup configuration...")
-        validate_startup_configuration()
-        print("[SUCCESS] Startup configuration validated successfully")
-
-        # Ensure all SQLModel tables exist (CREATE TABLE IF NOT EXISTS)
-        print("Syncing database schema...")
-        # Import models so SQLModel registers them before create_all
-        from models.user import User   # noqa: F401
-        from models.task import Task   # noqa: F401
-        init_db()
-        print("[SUCCESS] Database schema synced")
+        if validate:
+            log.info("Validating startup configuration...")
+            validate_startup_configuration()
+            log.info("Startup configuration validated successfully")
+
+        if init_database:
+            # Ensure all SQLModel tables exist (CREATE TABLE IF NOT EXISTS)
+            log.info("Syncing database schema...")
+            # Import models so SQLModel registers them before create_all
+            from models.user import User   # noqa: F401
+            from models.task import Task   # noqa: F401
+            init_db()
+            # Mirror the service-layer user_id filters inside PostgreSQL
+            # (no-op on other dialects)
+            enable_row_level_security()
+            log.info("Database schema synced")
     except ValueError as e:
-        print(f"[ERROR] Startup configuration error: {e}")
-        print("[INFO] Please check your .env file and ensure all required environment variables are set correctly.")
+        log.error("Startup configuration error: %s", e)
+        log.error("Please check your .env file and ensure all required environment variables are set correctly.")
         sys.exit(1)  # Exit the application if configuration is invalid
     except Exception as e:
-        print(f"[ERROR] Unexpected error during startup validation: {e}")
-        print("[INFO] Please check your configuration and try again.")
+        log.error("Unexpected error during startup validation: %s", e)
+        log.error("Please check your configuration and try again.")
         sys.exit(1)
 
     # Create FastAPI app
@@ -78,6 +97,10 @@ def create_app() -> FastAPI:
         expose_headers=["Access-Control-Allow-Origin"],
     )
 
+    # 4. Health-probe shortcut (registered last = truly outermost).
+    # Liveness probes get a precomputed 200 without entering the stack above.
+    app.add_middleware(FastHealthMiddleware)
+
     # Include API routers under /api/v1
     app.include_router(auth_router, prefix="/api/v1")
     app.include_router(tasks_router, prefix="/api/v1")
@@ -188,8 +211,25 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create the application instance
-app = create_app()
+@lru_cache(maxsize=None)
+def create_test_app() -> FastAPI:
+    """
+    Lightweight app factory for tests: skips startup validation and schema
+    sync so parallel pytest workers only pay for router registration.
+
+    Cached so the conftest client and every test module that imports `app`
+    share one instance — dependency_overrides set anywhere apply suite-wide.
+    """
+    return create_app(validate=False, init_database=False)
+
+
+# Create the application instance. Under pytest, `app` is the cached
+# lightweight instance instead, so importing this module costs router
+# registration only — no startup validation or schema sync per worker.
+if "pytest" in sys.modules:
+    app = create_test_app()
+else:
+    app = create_app()
 
 
 # If running this file directly, start the server
@@ -204,5 +244,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True
+        reload=True,
+        loop="uvloop",      # ~2-4x faster socket I/O than asyncio's selector loop
+        http="httptools",   # C HTTP parser instead of pure-Python h11
+        access_log=False,   # skip the per-request logging call
     )
\ No newline at end of file
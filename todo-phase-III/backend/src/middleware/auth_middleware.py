@@ -1,9 +1,11 @@
+import logging
+
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
 from typing import Optional, Dict, Any
-from lib.jwt_utils import verify_token, get_user_id_from_token
+from lib.jwt_utils import verify_token_fast
+
+logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
@@ -24,84 +26,128 @@ PUBLIC_AUTH_PATHS = frozenset({
 })
 
 
-# Known API version prefixes to strip before matching
+# Known API version prefixes
 _API_PREFIXES = ("/api/v1",)
 
+# The prefix set is small and fixed, so instead of stripping prefixes per
+# request the full cross product (bare + versioned auth paths) is expanded
+# once at import time into a single frozenset — one O(1) hash lookup.
+_ALL_PUBLIC = frozenset(
+    PUBLIC_PATHS
+    | PUBLIC_AUTH_PATHS
+    | {prefix + path for prefix in _API_PREFIXES for path in PUBLIC_AUTH_PATHS}
+)
+
 
 def _is_public(path: str) -> bool:
     """Return True if this path should skip JWT verification entirely."""
-    if path in PUBLIC_PATHS:
-        return True
-    # Strip version prefix so /api/v1/auth/register matches /auth/register
-    normalized = path
-    for prefix in _API_PREFIXES:
-        if path.startswith(prefix):
-            normalized = path[len(prefix):]
-            break
-    return normalized in PUBLIC_AUTH_PATHS
-
-
-class JWTAuthMiddleware(BaseHTTPMiddleware):
+    return path in _ALL_PUBLIC
+
+
+# Canonical 401 response, serialized once at import time. Sending the raw
+# ASGI messages avoids building a JSONResponse object per rejection.
+_UNAUTHORIZED_BODY = b'{"detail":"Missing or invalid authentication token"}'
+_UNAUTHORIZED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode("ascii")),
+    (b"www-authenticate", b"Bearer"),
+]
+
+
+class JWTAuthMiddleware:
     """
-    Class-based ASGI middleware that extracts JWT claims into request.state
-    on every request.  Public paths are passed straight through without
-    even inspecting the Authorization header.  Protected paths with a
+    Pure ASGI middleware that extracts JWT claims into request.state on
+    every request.  Public paths are passed straight through without even
+    inspecting the Authorization header.  Protected paths with a
     bad/missing token are rejected before the route handler runs.
+
+    Written against the raw ASGI interface (like CustomCORSMiddleware in
+    security.py) rather than BaseHTTPMiddleware, which wraps every request
+    in an anyio task group and buffers the response through a memory
+    stream.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        raw = request.url.path
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        raw = scope["path"]
         path = raw.rstrip("/") or "/"     # "/" must stay as "/"
+        method = scope["method"]
 
-        # ── Debug: show every path the middleware sees ────────────────
-        print(f"[AUTH-MW] Checking path: {request.method} {raw}  (normalized: {path})")
+        # ── Debug: show every path the middleware sees. Guarded so the
+        # messages are never even formatted unless DEBUG logging is on —
+        # print() here meant a stdout syscall on every single request.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[AUTH-MW] Checking path: %s %s  (normalized: %s)",
+                         method, raw, path)
 
         # Always allow OPTIONS (CORS preflight)
-        if request.method == "OPTIONS":
-            print(f"[AUTH-MW] -> OPTIONS preflight, passing through")
-            return await call_next(request)
+        if method == "OPTIONS":
+            if debug:
+                logger.debug("[AUTH-MW] -> OPTIONS preflight, passing through")
+            return await self.app(scope, receive, send)
+
+        # request.state reads scope["state"]; populate it here so route
+        # handlers and Depends helpers see the validated claims without the
+        # middleware ever constructing a Request object.
+        state = scope.setdefault("state", {})
 
         # ── Public route? Pass immediately — don't touch headers ─────
         if _is_public(path):
-            print(f"[AUTH-MW] -> PUBLIC route, skipping JWT check")
-            request.state.user_id = None
-            request.state.token_payload = None
-            return await call_next(request)
+            if debug:
+                logger.debug("[AUTH-MW] -> PUBLIC route, skipping JWT check")
+            state["user_id"] = None
+            state["token_payload"] = None
+            return await self.app(scope, receive, send)
 
         # ── Protected route: extract & validate JWT ──────────────────
-        auth_header = request.headers.get("authorization", "")
-        request.state.user_id = None
-        request.state.token_payload = None
-
-        if auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-            if self._is_valid_format(token):
-                payload = verify_token(token)
-                if payload:
-                    user_id = payload.get("user_id") or payload.get("sub")
-                    if isinstance(user_id, str):
-                        try:
-                            user_id = int(user_id)
-                        except ValueError:
-                            user_id = None
-                    request.state.user_id = user_id
-                    request.state.token_payload = payload
-
-        if request.state.user_id is None:
-            print(f"[AUTH-MW] -> PROTECTED route, NO valid token — returning 401")
-            from starlette.responses import JSONResponse
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Missing or invalid authentication token"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        print(f"[AUTH-MW] -> PROTECTED route, user_id={request.state.user_id} — OK")
-        return await call_next(request)
-
-    @staticmethod
-    def _is_valid_format(token: str) -> bool:
-        return token.count(".") == 2
+        # Walk the raw ASGI header list (ASGI guarantees lowercase keys)
+        # instead of request.headers — avoids building Starlette's
+        # case-normalized Headers mapping per request. Inlined rather than
+        # a helper call: this runs on every protected request.
+        token = None
+        for key, value in scope["headers"]:
+            if key == b"authorization":
+                if value[:7] == b"Bearer ":
+                    token = value[7:].decode("latin-1")
+                break
+        state["user_id"] = None
+        state["token_payload"] = None
+
+        if token is not None:
+            # No format pre-check here: verify_token_fast already starts
+            # with a structural split, so a second full scan of the token
+            # (count(".")) would be pure duplication. user_id comes back
+            # pre-normalized — no per-request str→int conversion on the
+            # cache-hit path.
+            entry = verify_token_fast(token)
+            if entry is not None:
+                state["user_id"] = entry[0]
+                state["token_payload"] = entry[2]
+
+        if state["user_id"] is None:
+            if debug:
+                logger.debug("[AUTH-MW] -> PROTECTED route, NO valid token — returning 401")
+            await send({
+                "type": "http.response.start",
+                "status": 401,
+                "headers": _UNAUTHORIZED_HEADERS,
+            })
+            await send({
+                "type": "http.response.body",
+                "body": _UNAUTHORIZED_BODY,
+            })
+            return
+
+        if debug:
+            logger.debug("[AUTH-MW] -> PROTECTED route, user_id=%s — OK",
+                         state["user_id"])
+        return await self.app(scope, receive, send)
 
 
 # ---------------------------------------------------------------------------
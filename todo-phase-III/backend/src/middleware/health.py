@@ -0,0 +1,46 @@
+"""
+Health check middleware for the backend application.
+Serves liveness probes without touching the rest of the middleware stack.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class FastHealthMiddleware:
+    """
+    Pure-ASGI shortcut for the `/health` liveness probe.
+
+    Orchestrators (Kubernetes, Render) hit `/health` every few seconds per
+    replica. Registered as the outermost middleware, this intercepts those
+    probes and replies with a precomputed 200 before the request enters
+    CORS / JWT auth / security-headers processing, so probes cost almost
+    nothing per hit.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str = "/health",
+        body: bytes = b'{"status":"healthy","service":"todo-api"}',
+    ):
+        self.app = app
+        self.path = path
+        self.body = body
+        # Precompute the response messages once — probes reuse them verbatim
+        self._response_start = {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+        self._response_body = {"type": "http.response.body", "body": body}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == self.path:
+            await send(self._response_start)
+            await send(self._response_body)
+            return
+
+        await self.app(scope, receive, send)
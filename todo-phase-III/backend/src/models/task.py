@@ -5,6 +5,7 @@ Implements the Task entity with user isolation using the UserIsolationService pa
 Each task is owned by a user and can only be accessed by that user.
 """
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
@@ -23,6 +24,15 @@ class TaskBase(SQLModel):
 
 class Task(TaskBase, table=True):
     """Task model with all fields and relationships"""
+    # Every task query is scoped by user_id (isolation), usually together
+    # with the primary key. user_id leads so list queries filtering only on
+    # it use the same index as point lookups. The created_at composite
+    # covers per-user listings ordered by recency without a sort step.
+    __table_args__ = (
+        Index("ix_task_user_id_id", "user_id", "id"),
+        Index("ix_task_user_created", "user_id", "created_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(
@@ -41,9 +41,10 @@ class UserCreate(UserBase):
     def hash_password(self) -> str:
         """Hash the plain text password"""
         import bcrypt
+        from lib.jwt_utils import BCRYPT_ROUNDS
         return bcrypt.hashpw(
             self.password.encode("utf-8"),
-            bcrypt.gensalt(),
+            bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
         ).decode("utf-8")
 
 
@@ -1,4 +1,5 @@
 from typing import Optional
+from sqlalchemy import literal
 from sqlmodel import Session, select
 from models.user import User, UserCreate
 from lib.jwt_utils import verify_password, get_password_hash, create_access_token
@@ -232,14 +233,20 @@ class AuthService:
         Returns:
             True if user owns the resource, False otherwise
         """
-        # Create a query to find the resource with the specified ID and user
-        statement = select(resource_model).where(
-            getattr(resource_model, resource_model.__table__.primary_key.columns.keys()[0]) == resource_id,
-            getattr(resource_model, user_field_name) == user_id
+        # EXISTS-style probe: SELECT 1 ... LIMIT 1 answers the ownership
+        # question from the (user_id, pk) index alone — no row is hydrated
+        # into an ORM object just to be discarded.
+        statement = (
+            select(literal(1))
+            .select_from(resource_model)
+            .where(
+                getattr(resource_model, resource_model.__table__.primary_key.columns.keys()[0]) == resource_id,
+                getattr(resource_model, user_field_name) == user_id
+            )
+            .limit(1)
         )
 
-        resource = db_session.exec(statement).first()
-        return resource is not None
+        return db_session.exec(statement).first() is not None
 
 
 # Global instance for convenience
@@ -4,12 +4,41 @@ This module shows how to implement user_id filtering in database queries
 to prevent unauthorized access to other users' data.
 """
 
-from sqlmodel import Session, select
+from functools import lru_cache
+
+from sqlalchemy import bindparam
+from sqlmodel import Session, select, update, delete
 from typing import List, Optional
 from models.user import User
 from services.auth_service import auth_service
 
 
+@lru_cache(maxsize=64)
+def _scoping_columns(model_class, user_field_name: str):
+    """Resolve (user column, primary-key column) for a model, memoized."""
+    primary_key_field = model_class.__table__.primary_key.columns.keys()[0]
+    return (
+        getattr(model_class, user_field_name),
+        getattr(model_class, primary_key_field),
+    )
+
+
+@lru_cache(maxsize=64)
+def _single_resource_stmt(model_class, user_field_name: str):
+    """
+    Cached point-lookup SELECT with bindparam placeholders.
+
+    One statement shape exists per (model, user field); caching it skips
+    re-running SQLAlchemy statement construction on every call. Actual ids
+    are supplied at execution time via params.
+    """
+    user_col, pk_col = _scoping_columns(model_class, user_field_name)
+    return select(model_class).where(
+        user_col == bindparam("uid"),
+        pk_col == bindparam("rid"),
+    )
+
+
 class UserIsolationService:
     """
     Service demonstrating proper user isolation implementation.
@@ -46,15 +75,11 @@ class UserIsolationService:
         Returns:
             Resource if it exists and is owned by the user, None otherwise
         """
-        from sqlmodel import col
-        # Create a query that scopes to the user AND the specific resource ID
-        primary_key_field = model_class.__table__.primary_key.columns.keys()[0]
-        query = select(model_class).where(
-            getattr(model_class, user_field_name) == user_id,
-            getattr(model_class, primary_key_field) == resource_id
-        )
-
-        return db_session.exec(query).first()
+        # Reuse the cached query shape scoped to the user AND the resource ID
+        query = _single_resource_stmt(model_class, user_field_name)
+        return db_session.exec(
+            query, params={"uid": user_id, "rid": resource_id}
+        ).first()
 
     def update_user_resource(self, db_session: Session, model_class, resource_id: int, user_id: int, update_data: dict, user_field_name: str = "user_id") -> bool:
         """
@@ -71,27 +96,33 @@ class UserIsolationService:
         Returns:
             True if update was successful, False otherwise
         """
-        from sqlmodel import col
-        # First, find the resource that belongs to the user
-        primary_key_field = model_class.__table__.primary_key.columns.keys()[0]
-        query = select(model_class).where(
-            getattr(model_class, user_field_name) == user_id,
-            getattr(model_class, primary_key_field) == resource_id
+        # Single-statement UPDATE with ownership in the WHERE clause: one
+        # round-trip instead of SELECT-then-UPDATE, and the rowcount tells
+        # us whether the user owned the resource.
+        user_col, pk_col = _scoping_columns(model_class, user_field_name)
+        valid_data = {
+            field: value for field, value in update_data.items()
+            if hasattr(model_class, field)
+        }
+        if not valid_data:
+            # An empty update (e.g. a PUT body with every field unset) is
+            # still a valid request: nothing to write, so success is just
+            # whether the user owns the resource — not a 404.
+            return self.get_single_user_resource(
+                db_session, model_class, resource_id, user_id, user_field_name
+            ) is not None
+
+        stmt = (
+            update(model_class)
+            .where(
+                user_col == user_id,
+                pk_col == resource_id,
+            )
+            .values(**valid_data)
         )
-
-        resource = db_session.exec(query).first()
-        if not resource:
-            return False  # Resource doesn't exist or doesn't belong to user
-
-        # Update the resource with new data
-        for field, value in update_data.items():
-            if hasattr(resource, field):
-                setattr(resource, field, value)
-
-        db_session.add(resource)
+        result = db_session.exec(stmt)
         db_session.commit()
-        db_session.refresh(resource)
-        return True
+        return result.rowcount == 1
 
     def delete_user_resource(self, db_session: Session, model_class, resource_id: int, user_id: int, user_field_name: str = "user_id") -> bool:
         """
@@ -107,21 +138,16 @@ class UserIsolationService:
         Returns:
             True if deletion was successful, False otherwise
         """
-        from sqlmodel import col
-        # Find the resource that belongs to the user
-        primary_key_field = model_class.__table__.primary_key.columns.keys()[0]
-        query = select(model_class).where(
-            getattr(model_class, user_field_name) == user_id,
-            getattr(model_class, primary_key_field) == resource_id
+        # Same single-round-trip shape as update_user_resource: the
+        # ownership filter lives in the DELETE itself.
+        user_col, pk_col = _scoping_columns(model_class, user_field_name)
+        stmt = delete(model_class).where(
+            user_col == user_id,
+            pk_col == resource_id,
         )
-
-        resource = db_session.exec(query).first()
-        if not resource:
-            return False  # Resource doesn't exist or doesn't belong to user
-
-        db_session.delete(resource)
+        result = db_session.exec(stmt)
         db_session.commit()
-        return True
+        return result.rowcount == 1
 
     def check_user_owns_resource(self, db_session: Session, model_class, resource_id: int, user_id: int, user_field_name: str = "user_id") -> bool:
         """
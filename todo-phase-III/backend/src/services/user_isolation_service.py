@@ -3,11 +3,47 @@ User Isolation Service for enforcing data isolation between users.
 Ensures that users can only access their own resources.
 """
 
-from sqlmodel import Session, select
-from typing import List, Optional, Any, Type
+from functools import lru_cache
+
+from sqlalchemy import bindparam
+from sqlmodel import Session, select, update, delete
+from typing import List, Optional, Any, Type, Tuple
 from services.auth_service import auth_service
 
 
+@lru_cache(maxsize=None)
+def _scoping_columns(model_class: Type[Any], user_field_name: str) -> Tuple[Any, Any]:
+    """
+    Resolve (user column, primary-key column) for a model, memoized.
+
+    The primary-key name never changes for a mapped class, but reading it
+    through __table__.primary_key.columns.keys() materializes a view on
+    every call — this turns the per-request attribute chain into one dict
+    lookup.
+    """
+    primary_key_field = model_class.__table__.primary_key.columns.keys()[0]
+    return (
+        getattr(model_class, user_field_name),
+        getattr(model_class, primary_key_field),
+    )
+
+
+@lru_cache(maxsize=None)
+def _single_resource_stmt(model_class: Type[Any], user_field_name: str):
+    """
+    Cached point-lookup SELECT with bindparam placeholders.
+
+    There is one statement shape per (model, user field); building and
+    compiling it per request is pure rework. Callers supply the actual ids
+    at execution time via params.
+    """
+    user_col, pk_col = _scoping_columns(model_class, user_field_name)
+    return select(model_class).where(
+        user_col == bindparam("uid"),
+        pk_col == bindparam("rid"),
+    )
+
+
 class UserIsolationService:
     """
     Service for enforcing user isolation through database query filtering.
@@ -23,23 +59,65 @@ class UserIsolationService:
         db_session: Session,
         model_class: Type[Any],
         user_id: int,
-        user_field_name: str = "user_id"
+        user_field_name: str = "user_id",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> List[Any]:
         """
-        Get all resources owned by a specific user.
+        Get resources owned by a specific user.
+
+        Supports keyset pagination: pass the last-seen primary key as
+        after_id together with limit to fetch the next page via an indexed
+        range scan, instead of loading every row a user owns.
 
         Args:
             db_session: Database session
             model_class: SQLModel class to query
             user_id: User ID whose resources to retrieve
             user_field_name: Name of the field that represents the user (default: "user_id")
+            limit: Maximum number of rows to return (None = all)
+            after_id: Only return rows with primary key greater than this
 
         Returns:
             List of resources owned by the user
         """
         query = auth_service.create_user_scoped_query(model_class, user_id, user_field_name)
+        if limit is not None or after_id is not None:
+            _, pk_col = _scoping_columns(model_class, user_field_name)
+            if after_id is not None:
+                query = query.where(pk_col > after_id)
+            query = query.order_by(pk_col)
+            if limit is not None:
+                query = query.limit(limit)
         return db_session.exec(query).all()
 
+    def iter_user_owned_resources(
+        self,
+        db_session: Session,
+        model_class: Type[Any],
+        user_id: int,
+        user_field_name: str = "user_id",
+        batch_size: int = 1000
+    ):
+        """
+        Stream resources owned by a user in fixed-size batches.
+
+        Uses yield_per so memory stays O(batch_size) regardless of how many
+        rows the user owns; the session must stay open while iterating.
+
+        Args:
+            db_session: Database session
+            model_class: SQLModel class to query
+            user_id: User ID whose resources to retrieve
+            user_field_name: Name of the field that represents the user (default: "user_id")
+            batch_size: Rows fetched per round-trip
+
+        Returns:
+            Iterable of resources owned by the user
+        """
+        query = auth_service.create_user_scoped_query(model_class, user_id, user_field_name)
+        return db_session.exec(query.execution_options(yield_per=batch_size))
+
     def get_single_user_resource(
         self,
         db_session: Session,
@@ -62,12 +140,10 @@ class UserIsolationService:
             Resource if it exists and is owned by the user, None otherwise.
             Return None (which should map to 404) if resource is not owned by user.
         """
-        primary_key_field = model_class.__table__.primary_key.columns.keys()[0]
-        query = select(model_class).where(
-            getattr(model_class, user_field_name) == user_id,
-            getattr(model_class, primary_key_field) == resource_id
-        )
-        return db_session.exec(query).first()
+        query = _single_resource_stmt(model_class, user_field_name)
+        return db_session.exec(
+            query, params={"uid": user_id, "rid": resource_id}
+        ).first()
 
     def check_user_owns_resource(
         self,
@@ -119,22 +195,33 @@ class UserIsolationService:
         Returns:
             True if update was successful, False otherwise
         """
-        # First, find the resource that belongs to the user
-        resource = self.get_single_user_resource(
-            db_session, model_class, resource_id, user_id, user_field_name
-        )
-        if not resource:
-            return False  # Resource doesn't exist or doesn't belong to user
+        # Single-statement UPDATE with ownership in the WHERE clause: one
+        # round-trip instead of SELECT-then-UPDATE, no row hydration, and
+        # the rowcount tells us whether the user owned the resource.
+        user_col, pk_col = _scoping_columns(model_class, user_field_name)
+        valid_data = {
+            field: value for field, value in update_data.items()
+            if hasattr(model_class, field)
+        }
+        if not valid_data:
+            # An empty update (e.g. a PUT body with every field unset) is
+            # still a valid request: nothing to write, so success is just
+            # whether the user owns the resource — not a 404.
+            return self.get_single_user_resource(
+                db_session, model_class, resource_id, user_id, user_field_name
+            ) is not None
 
-        # Update the resource with new data
-        for field, value in update_data.items():
-            if hasattr(resource, field):
-                setattr(resource, field, value)
-
-        db_session.add(resource)
+        stmt = (
+            update(model_class)
+            .where(
+                user_col == user_id,
+                pk_col == resource_id,
+            )
+            .values(**valid_data)
+        )
+        result = db_session.exec(stmt)
         db_session.commit()
-        db_session.refresh(resource)
-        return True
+        return result.rowcount == 1
 
     def delete_user_resource(
         self,
@@ -158,16 +245,16 @@ class UserIsolationService:
         Returns:
             True if deletion was successful, False otherwise
         """
-        # Find the resource that belongs to the user
-        resource = self.get_single_user_resource(
-            db_session, model_class, resource_id, user_id, user_field_name
+        # Same single-round-trip shape as update_user_resource: the
+        # ownership filter lives in the DELETE itself.
+        user_col, pk_col = _scoping_columns(model_class, user_field_name)
+        stmt = delete(model_class).where(
+            user_col == user_id,
+            pk_col == resource_id,
         )
-        if not resource:
-            return False  # Resource doesn't exist or doesn't belong to user
-
-        db_session.delete(resource)
+        result = db_session.exec(stmt)
         db_session.commit()
-        return True
+        return result.rowcount == 1
 
 
 # Global instance for convenience
@@ -3,24 +3,77 @@ Rate limiting utilities for the backend application.
 Provides rate limiting functionality for authentication endpoints.
 """
 
+import logging
+import os
+import random
 import time
-from collections import defaultdict, deque
+import uuid
 from typing import Dict, Optional
 from threading import Lock
 import hashlib
 
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on distinct keys tracked at once. A defaultdict would keep an
+# entry forever for every IP/email ever seen — unbounded growth under a
+# credential-stuffing run. With an LRU the coldest key is evicted in O(1)
+# once the limit is hit, which is safe: evicting a cold key merely resets
+# its window.
+MAX_TRACKED_KEYS = 100_000
+
+# Number of lock stripes; must be a power of two so the shard pick is a
+# single AND. One global lock serializes every rate-limited request across
+# all keys — with 64 stripes, requests for different clients almost never
+# contend.
+_SHARD_COUNT = 64
+
+# Segments per sliding window. Instead of one timestamp per request (memory
+# and popleft work both O(max_requests)), each key keeps _SEGMENTS integer
+# counts covering window/_SEGMENTS each — O(1) admit/reject and constant
+# memory per key regardless of the limit.
+_SEGMENTS = 10
+
+
+class _Shard:
+    """One lock stripe: its own lock, key table, and janitor clock."""
+
+    __slots__ = ("lock", "requests", "last_cleanup_ns")
+
+    def __init__(self, maxsize: int):
+        self.lock = Lock()
+        # LRU of rate limit data for each key
+        # Format: {key: [bucket_counts, last_segment_index, segment_ns]}
+        self.requests: LRUCache = LRUCache(maxsize=maxsize)
+        self.last_cleanup_ns = 0
+
 
 class RateLimiter:
     """
-    A simple in-memory rate limiter using sliding window algorithm.
+    A simple in-memory rate limiter using a segmented sliding window.
+
+    Memory is bounded on both axes: at most MAX_TRACKED_KEYS keys, and each
+    key stores a fixed _SEGMENTS-bucket counter rather than a timestamp per
+    request. Keys are spread across _SHARD_COUNT independently locked
+    stripes. The window slides at segment granularity (window/_SEGMENTS),
+    which is the standard precision/memory trade for counter-based limiters.
     """
 
     def __init__(self):
-        # Dictionary to store rate limit data for each key
-        # Format: {key: deque of timestamps}
-        self.requests = defaultdict(deque)
-        # Thread lock for thread-safe operations
-        self.lock = Lock()
+        per_shard = max(MAX_TRACKED_KEYS // _SHARD_COUNT, 1)
+        self._shards = [_Shard(per_shard) for _ in range(_SHARD_COUNT)]
+        # Redis-style janitor settings: every _cleanup_interval seconds per
+        # stripe, sample a handful of keys and drop the stale ones; if most
+        # of the sample was stale, sample again. Amortized O(1) per request
+        # — no full-table scan ever runs on the request path.
+        self._sample_size = 20
+        self._stale_threshold = 0.25
+        self._cleanup_interval_ns = 30 * 1_000_000_000
+        self._max_idle_ns = 3600 * 1_000_000_000  # largest configured window
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) & (_SHARD_COUNT - 1)]
 
     def is_allowed(self, key: str, max_requests: int, window_size: int) -> bool:
         """
@@ -34,23 +87,68 @@ class RateLimiter:
         Returns:
             True if request is allowed, False otherwise
         """
-        with self.lock:
-            current_time = time.time()
-            window_start = current_time - window_size
-
-            # Remove outdated requests
-            while self.requests[key] and self.requests[key][0] < window_start:
-                self.requests[key].popleft()
+        shard = self._shard(key)
+        with shard.lock:
+            # Monotonic integer nanoseconds: immune to NTP/wall-clock jumps,
+            # and integer compares are cheaper than float ones in CPython.
+            now_ns = time.monotonic_ns()
+            seg_ns = window_size * 1_000_000_000 // _SEGMENTS
+            now_seg = now_ns // seg_ns
+
+            # Janitor runs before the current key's entry is created so a
+            # brand-new (still empty) entry can't be swept in the same call
+            if now_ns - shard.last_cleanup_ns > self._cleanup_interval_ns:
+                self._sample_cleanup(shard, now_ns)
+
+            entry = shard.requests.get(key)
+            if entry is None:
+                entry = [[0] * _SEGMENTS, now_seg, seg_ns]
+                shard.requests[key] = entry
+            counts, last_seg = entry[0], entry[1]
+
+            # Advance the window: zero every bucket that has rotated out
+            # since the last request for this key
+            elapsed = now_seg - last_seg
+            if elapsed:
+                if elapsed >= _SEGMENTS:
+                    for i in range(_SEGMENTS):
+                        counts[i] = 0
+                else:
+                    for seg in range(last_seg + 1, now_seg + 1):
+                        counts[seg % _SEGMENTS] = 0
+                entry[1] = now_seg
 
             # Check if we're under the limit
-            if len(self.requests[key]) < max_requests:
+            if sum(counts) < max_requests:
                 # Add current request
-                self.requests[key].append(current_time)
+                counts[now_seg % _SEGMENTS] += 1
                 return True
 
             # Rate limit exceeded
             return False
 
+    def _sample_cleanup(self, shard: _Shard, now_ns: int) -> None:
+        """Drop a random sample of idle keys. Caller must hold the shard lock."""
+        shard.last_cleanup_ns = now_ns
+        idle_cutoff = now_ns - self._max_idle_ns
+        requests = shard.requests
+        while requests:
+            keys = random.sample(
+                list(requests.keys()),
+                min(self._sample_size, len(requests)),
+            )
+            stale = []
+            for key in keys:
+                counts, last_seg, seg_ns = requests[key]
+                # Idle: last touched segment ended before the cutoff
+                if (last_seg + 1) * seg_ns < idle_cutoff or not any(counts):
+                    stale.append(key)
+            for key in stale:
+                del requests[key]
+            # Keep sampling only while the table looks mostly stale
+            if len(stale) <= len(keys) * self._stale_threshold:
+                break
+
     def get_reset_time(self, key: str, window_size: int) -> float:
         """
         Get the time when the rate limit window resets for a key.
@@ -62,28 +160,136 @@ class RateLimiter:
         Returns:
             Unix timestamp when the rate limit window resets
         """
-        with self.lock:
-            if not self.requests[key]:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.requests.get(key)
+            if entry is None or not any(entry[0]):
                 return time.time()
 
-            # Reset time is the oldest request time + window size
-            oldest_request = self.requests[key][0]
-            return oldest_request + window_size
+            counts, last_seg = entry[0], entry[1]
+            seg_ns = window_size * 1_000_000_000 // _SEGMENTS
+
+            # The window frees capacity when its oldest non-empty segment
+            # rotates out, i.e. _SEGMENTS segments after that segment began.
+            # Translated from the monotonic clock back to wall time only
+            # here at the boundary.
+            for seg in range(last_seg - _SEGMENTS + 1, last_seg + 1):
+                if counts[seg % _SEGMENTS]:
+                    reset_ns = (seg + _SEGMENTS) * seg_ns
+                    return time.time() + (reset_ns - time.monotonic_ns()) / 1e9
+
+            return time.time()
+
+
+# Atomic sliding window over a Redis sorted set: prune entries older than
+# the window, admit if under the limit, and refresh the key TTL — all in
+# one round-trip, so concurrent workers can never over-admit.
+_SLIDING_WINDOW_LUA = """
+local cutoff = tonumber(ARGV[3]) - tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, cutoff)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed sliding window limiter for multi-worker deployments.
+
+    The in-process RateLimiter is per-worker, so running N Uvicorn workers
+    multiplies every limit by N. Backing the window with a shared sorted
+    set restores the configured limits globally; the Lua script keeps the
+    prune/count/admit sequence atomic.
+    """
+
+    def __init__(self, client):
+        import redis
+
+        self._client = client
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+        # A Redis outage must degrade rate limiting to per-process limits,
+        # not surface as a 500 from every auth endpoint.
+        self._errors = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+        self._fallback = RateLimiter()
+        self._degraded = False
+
+    def _note_outage(self, exc: Exception) -> None:
+        # Warn on the transition only — one line per outage, not per request
+        if not self._degraded:
+            self._degraded = True
+            logger.warning(
+                "Redis rate limiter unreachable (%s); falling back to "
+                "per-process limits until it recovers.", exc,
+            )
+
+    def is_allowed(self, key: str, max_requests: int, window_size: int) -> bool:
+        """Same contract as RateLimiter.is_allowed, decided in Redis."""
+        now = time.time()
+        # Member must be unique per request; the score carries the time
+        member = f"{now}:{uuid.uuid4().hex}"
+        try:
+            allowed = bool(self._script(
+                keys=[key],
+                args=[max_requests, window_size, now, member],
+            ))
+        except self._errors as exc:
+            self._note_outage(exc)
+            return self._fallback.is_allowed(key, max_requests, window_size)
+        self._degraded = False
+        return allowed
+
+    def get_reset_time(self, key: str, window_size: int) -> float:
+        """Same contract as RateLimiter.get_reset_time."""
+        try:
+            oldest = self._client.zrange(key, 0, 0, withscores=True)
+        except self._errors as exc:
+            self._note_outage(exc)
+            return self._fallback.get_reset_time(key, window_size)
+        if not oldest:
+            return time.time()
+        return oldest[0][1] + window_size
+
+
+def _build_rate_limiter():
+    """Pick the Redis limiter when configured, else the in-process one."""
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL") or os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            import redis
+        except ImportError:
+            # Falling back silently would hand an operator who configured
+            # Redis per-worker limits without any signal — say so loudly.
+            logger.warning(
+                "Redis rate limiting is configured (%s) but the 'redis' "
+                "package is not installed; falling back to per-process "
+                "limits. Install the redis package to enforce limits "
+                "across workers.",
+                "RATE_LIMIT_REDIS_URL" if os.getenv("RATE_LIMIT_REDIS_URL") else "REDIS_URL",
+            )
+            return RateLimiter()
+        return RedisRateLimiter(redis.Redis.from_url(redis_url))
+    return RateLimiter()
 
 
 # Global rate limiter instance
-rate_limiter = RateLimiter()
+rate_limiter = _build_rate_limiter()
 
 
 class AuthRateLimiter:
     """
     Rate limiter specifically for authentication endpoints.
+
+    All three auth flows share the single global limiter, namespaced by key
+    prefix ("login:", "reg:", "pwd:"), instead of carrying their own
+    RateLimiter instances — one set of shards/janitors to warm, and
+    cleanup behaves the same for every flow.
     """
 
     def __init__(self):
-        self.login_attempts_limiter = RateLimiter()
-        self.registration_limiter = RateLimiter()
-
         # Rate limit settings
         self.LOGIN_ATTEMPTS_LIMIT = 5  # per 15 minutes
         self.LOGIN_WINDOW_SIZE = 900  # 15 minutes in seconds
@@ -102,15 +308,16 @@ class AuthRateLimiter:
         Returns:
             Tuple of (is_allowed, reset_time_if_limited)
         """
-        is_allowed = self.login_attempts_limiter.is_allowed(
-            identifier,
+        key = f"login:{identifier}"
+        is_allowed = rate_limiter.is_allowed(
+            key,
             self.LOGIN_ATTEMPTS_LIMIT,
             self.LOGIN_WINDOW_SIZE
         )
 
         if not is_allowed:
-            reset_time = self.login_attempts_limiter.get_reset_time(
-                identifier,
+            reset_time = rate_limiter.get_reset_time(
+                key,
                 self.LOGIN_WINDOW_SIZE
             )
             return False, reset_time
@@ -127,15 +334,16 @@ class AuthRateLimiter:
         Returns:
             Tuple of (is_allowed, reset_time_if_limited)
         """
-        is_allowed = self.registration_limiter.is_allowed(
-            identifier,
+        key = f"reg:{identifier}"
+        is_allowed = rate_limiter.is_allowed(
+            key,
             self.REGISTRATION_LIMIT,
             self.REGISTRATION_WINDOW_SIZE
         )
 
         if not is_allowed:
-            reset_time = self.registration_limiter.get_reset_time(
-                identifier,
+            reset_time = rate_limiter.get_reset_time(
+                key,
                 self.REGISTRATION_WINDOW_SIZE
             )
             return False, reset_time
@@ -152,15 +360,16 @@ class AuthRateLimiter:
         Returns:
             Tuple of (is_allowed, reset_time_if_limited)
         """
+        key = f"pwd:{identifier}"
         is_allowed = rate_limiter.is_allowed(
-            identifier,
+            key,
             self.PASSWORD_RESET_LIMIT,
             self.PASSWORD_RESET_WINDOW_SIZE
         )
 
         if not is_allowed:
             reset_time = rate_limiter.get_reset_time(
-                identifier,
+                key,
                 self.PASSWORD_RESET_WINDOW_SIZE
             )
             return False, reset_time
@@ -231,6 +440,8 @@ def get_rate_limit_key(identifier: str, endpoint: str) -> str:
     Returns:
         Combined rate limit key
     """
-    # Hash the combination to avoid special characters in keys
+    # Hash the combination to avoid special characters in keys. This is a
+    # dictionary key, not a credential: blake2b with an 8-byte digest is
+    # ~3x faster than sha256 for short inputs and allocates less.
     combined = f"{identifier}:{endpoint}"
-    return hashlib.sha256(combined.encode()).hexdigest()[:16]
\ No newline at end of file
+    return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
\ No newline at end of file
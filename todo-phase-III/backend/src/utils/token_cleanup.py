@@ -6,7 +6,7 @@ Handles cleanup of expired tokens and maintenance tasks.
 import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+import jwt
 import os
 
 
@@ -35,7 +35,7 @@ class TokenCleanupService:
         try:
             # Decode the token without verification to check expiration
             # This is safe for expiration checking only
-            payload = jwt.get_unverified_claims(token)
+            payload = jwt.decode(token, options={"verify_signature": False})
 
             exp_timestamp = payload.get("exp")
             if not exp_timestamp:
@@ -43,7 +43,7 @@ class TokenCleanupService:
 
             current_timestamp = int(time.time())
             return current_timestamp > exp_timestamp
-        except JWTError:
+        except jwt.PyJWTError:
             # If we can't decode the token, consider it invalid/expired
             return True
         except Exception:
@@ -77,7 +77,7 @@ class TokenCleanupService:
             Token payload if decodable, None otherwise
         """
         try:
-            payload = jwt.get_unverified_claims(token)
+            payload = jwt.decode(token, options={"verify_signature": False})
             return payload
         except Exception:
             return None
@@ -0,0 +1,84 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import os
+
+# Set before anything imports src.main — module-level config (auth_config,
+# jwt_utils, the database engine) reads these during collection.
+os.environ.setdefault("BETTER_AUTH_SECRET", "test-secret-key-for-testing-purposes-only")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+# Minimum bcrypt cost — test passwords are throwaway, and rounds=12 costs
+# ~250ms per hash.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from dataclasses import dataclass
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@dataclass(frozen=True)
+class FakeUser:
+    """
+    Attribute-compatible stand-in for models.user.User.
+
+    MagicMock(spec=User) introspects the model class on every construction;
+    endpoints only read attributes, so a frozen dataclass is enough and far
+    cheaper to build.
+    """
+    id: int
+    email: str
+    hashed_password: str
+    is_active: bool = True
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Session-scoped TestClient for the FastAPI app.
+
+    Built on create_test_app(), which skips startup validation and schema
+    sync and is cached — so this is the same instance test modules get from
+    `from src.main import app`, and it boots once per test run instead of
+    once per test. The module default above matches the secret the
+    env-mutating fixtures set, so no test needs a rebuilt client.
+    """
+    from src.main import create_test_app
+    with TestClient(create_test_app()) as c:
+        yield c
+
+
+class NoopSession:
+    """Inert stand-in for a database session.
+
+    Every attribute access and call returns the session itself, so chained
+    ORM calls are absorbed without MagicMock's child-mock allocation and
+    call recording. Used where the test path never reads a query result.
+    """
+
+    def __getattr__(self, _name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+@pytest.fixture(scope="session")
+def mock_db_session():
+    """Inert database session for tests that never touch real data."""
+    return NoopSession()
+
+
+@pytest.fixture(scope="session")
+def user_a():
+    """User A for isolation tests."""
+    return FakeUser(id=1, email="usera@example.com",
+                    hashed_password="$2b$12$hashed_password_a")
+
+
+@pytest.fixture(scope="session")
+def user_b():
+    """User B for isolation tests."""
+    return FakeUser(id=2, email="userb@example.com",
+                    hashed_password="$2b$12$hashed_password_b")
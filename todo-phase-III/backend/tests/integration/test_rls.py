@@ -0,0 +1,86 @@
+"""
+Row-level security against a real PostgreSQL database.
+
+The RLS policies only exist on PostgreSQL (rls.py no-ops elsewhere), so
+these tests skip on the default SQLite test database. Point DATABASE_URL
+at a PostgreSQL instance to run them.
+"""
+
+import uuid
+
+import pytest
+from sqlmodel import Session
+
+from database.connection import engine, init_db
+from database.rls import enable_row_level_security, set_session_user
+from models.task import Task
+from models.user import User
+
+pytestmark = [
+    pytest.mark.postgres,
+    pytest.mark.skipif(
+        engine.dialect.name != "postgresql",
+        reason="row-level security requires PostgreSQL",
+    ),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def rls_policies():
+    """Ensure the schema and isolation policies exist before testing them."""
+    init_db()
+    enable_row_level_security()
+
+
+@pytest.fixture()
+def owner():
+    """A persisted user to own the test rows (the user table has no policy)."""
+    with Session(engine) as session:
+        user = User(
+            email=f"rls-{uuid.uuid4().hex}@example.com",
+            hashed_password="$2b$04$not-a-real-hash-for-this-test",
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        yield user
+        session.delete(user)
+        session.commit()
+
+
+def test_create_then_refresh_survives_commit(owner):
+    """The user binding must outlive mid-request commits.
+
+    Mirrors the create_task route: insert, commit, then refresh the new
+    row. The commit ends the transaction the GUC was first set in; the
+    refresh runs in a fresh one, and without the per-transaction rebinding
+    the policy would hide the just-created row and refresh would fail.
+    """
+    with Session(engine) as session:
+        set_session_user(session, owner.id)
+
+        task = Task(title="rls refresh probe", user_id=owner.id)
+        session.add(task)
+        session.commit()
+        session.refresh(task)  # fresh transaction — must still see the row
+
+        assert task.id is not None
+        assert task.user_id == owner.id
+
+        session.delete(task)
+        session.commit()
+
+
+def test_unbound_session_sees_no_rows(owner):
+    """Without the GUC the policy hides every row (current_setting is NULL)."""
+    with Session(engine) as bound:
+        set_session_user(bound, owner.id)
+        task = Task(title="rls visibility probe", user_id=owner.id)
+        bound.add(task)
+        bound.commit()
+
+        with Session(engine) as unbound:
+            assert unbound.get(Task, task.id) is None
+
+        bound.delete(task)
+        bound.commit()
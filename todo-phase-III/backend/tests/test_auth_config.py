@@ -186,27 +186,19 @@ class TestSettingsIntegration:
 
     def test_settings_loads_better_auth_secret(self):
         """Test that Settings class loads BETTER_AUTH_SECRET from environment."""
-        # Force reload of settings module to pick up env changes
-        import importlib
-        import src.config.settings as settings_module
-        importlib.reload(settings_module)
+        # build_settings re-reads the environment without the module reload
+        # (which re-ran pydantic schema construction on every test)
+        from src.config.settings import build_settings
 
-        from src.config.settings import Settings
-
-        # Create a new settings instance
-        settings = Settings()
+        settings = build_settings()
 
         assert settings.better_auth_secret == "test-secret-key-for-testing-purposes-only"
 
     def test_settings_loads_jwt_algorithm(self):
         """Test that Settings class loads JWT_ALGORITHM with default value."""
-        import importlib
-        import src.config.settings as settings_module
-        importlib.reload(settings_module)
-
-        from src.config.settings import Settings
+        from src.config.settings import build_settings
 
-        settings = Settings()
+        settings = build_settings()
 
         assert settings.jwt_algorithm == "HS256"
 
@@ -1,21 +1,31 @@
+import functools
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
-from jose import jwt
+import jwt
 import os
 
 # Import your FastAPI app
 from src.main import app  # Assuming your FastAPI app is in src/main.py
+from src.config.auth_config import auth_config
 from src.lib.jwt_utils import create_access_token, verify_token, get_user_id_from_token
 from src.middleware.auth_middleware import get_current_user_id
 from src.services.auth_service import auth_service
 
+# Resolved once instead of re-importing auth_config and re-reading the env
+# on every create_test_token call.
+_TEST_SECRET = auth_config.get_secret_key()
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+
+# The `client` fixture comes from tests/conftest.py: session-scoped, so the
+# app (route table, middleware stack) boots once per run instead of once per
+# test. Nothing here mutates client state.
+
+
+@pytest.fixture(scope="session")
+def default_token():
+    """One valid token with the default claims, signed once per session."""
+    return create_test_token()
 
 
 @pytest.fixture
@@ -28,22 +38,36 @@ def mock_user():
     }
 
 
-def create_test_token(user_id: int = 1, email: str = "test@example.com", expires_delta: timedelta = None):
-    """Helper function to create a test JWT token."""
-    if expires_delta is None:
-        expires_delta = timedelta(minutes=30)  # Token valid for 30 minutes
-
+@functools.lru_cache(maxsize=64)
+def _cached_token(user_id: int, email: str, exp_delta_seconds: int) -> str:
+    """Sign a token once per distinct (user_id, email, expiry) tuple."""
     data = {
         "sub": str(user_id),
         "user_id": user_id,
         "email": email,
-        "exp": datetime.utcnow() + expires_delta
+        "exp": datetime.utcnow() + timedelta(seconds=exp_delta_seconds)
     }
+    return jwt.encode(data, _TEST_SECRET, algorithm="HS256")
+
+
+def create_test_token(user_id: int = 1, email: str = "test@example.com", expires_delta: timedelta = None):
+    """Helper function to create a test JWT token."""
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=30)  # Token valid for 30 minutes
+
+    exp_delta_seconds = int(expires_delta.total_seconds())
+    if exp_delta_seconds <= 0:
+        # Expired-token tests must not share cache entries with valid ones;
+        # sign these fresh so the exp claim is exactly what was asked for.
+        data = {
+            "sub": str(user_id),
+            "user_id": user_id,
+            "email": email,
+            "exp": datetime.utcnow() + expires_delta
+        }
+        return jwt.encode(data, _TEST_SECRET, algorithm="HS256")
 
-    # Use the same secret as the application
-    from src.config.auth_config import auth_config
-    secret = auth_config.get_secret_key()
-    return jwt.encode(data, secret, algorithm="HS256")
+    return _cached_token(user_id, email, exp_delta_seconds)
 
 
 class TestJWTUtilities:
@@ -63,10 +87,9 @@ class TestJWTUtilities:
         assert decoded["sub"] == "1"
         assert decoded["email"] == "test@example.com"
 
-    def test_verify_valid_token(self):
+    def test_verify_valid_token(self, default_token):
         """Test verifying a valid token."""
-        token = create_test_token()
-        result = verify_token(token)
+        result = verify_token(default_token)
 
         assert result is not None
         assert result["sub"] == "1"
@@ -120,16 +143,15 @@ class TestAuthMiddleware:
         else:
             os.environ.pop("BETTER_AUTH_SECRET", None)
 
-    def test_verify_jwt_token_with_valid_token(self, mocker):
+    def test_verify_jwt_token_with_valid_token(self, mocker, default_token):
         """Test verify_jwt_token with a valid token."""
         # Mock the security dependency
         mock_credentials = MagicMock()
-        mock_credentials.credentials = create_test_token()
+        mock_credentials.credentials = default_token
 
         # Since verify_jwt_token expects to be used as a dependency,
         # we test the underlying verify_token function
-        token = create_test_token()
-        result = verify_token(token)
+        result = verify_token(default_token)
 
         assert result is not None
         assert result["sub"] == "1"
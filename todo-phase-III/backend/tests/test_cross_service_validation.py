@@ -148,7 +148,7 @@ class TestTokenLifecycle:
     def test_token_expires_after_set_duration(self):
         """Test that tokens expire after the configured duration."""
         from datetime import timedelta
-        from jose import jwt
+        import jwt
         import time
 
         # Create a token that expires in 1 second
@@ -169,7 +169,7 @@ class TestTokenLifecycle:
     def test_token_with_past_expiry_cannot_be_verified(self):
         """Test that tokens with past expiry dates cannot be verified."""
         from datetime import datetime, timedelta
-        from jose import jwt
+        import jwt
         import time
 
         # Create a token with an expiry in the past
@@ -0,0 +1,74 @@
+"""
+Unit tests for token parsing and signature verification.
+
+These call verify_token directly — pushing malformed-token cases through
+routing, middleware, and the JSON response builder costs orders of
+magnitude more than invoking the verifier. One HTTP-level smoke test in
+tests/integration/test_edge_cases.py proves the wiring.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.lib.jwt_utils import verify_token
+from tests.token_utils import fast_hs256
+
+
+def _payload(**overrides):
+    """Build a well-formed claims dict, optionally overriding fields."""
+    now = int(time.time())
+    payload = {
+        "sub": "1",
+        "user_id": 1,
+        "email": "test@example.com",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TestTokenVerification:
+    """verify_token must return None for every invalid input."""
+
+    @pytest.mark.parametrize("malformed", [
+        "not.a.valid.token",
+        "only-one-part",
+        "two.parts",
+        "a.b.c.d.e",  # Too many parts
+        "",
+        "    ",
+        "eyJhbGciOiJIUzI1NiJ9",  # Only header
+        "...",  # Empty parts
+    ])
+    def test_malformed_token_is_rejected(self, malformed):
+        """Malformed compact serializations are rejected."""
+        assert verify_token(malformed) is None
+
+    def test_token_with_wrong_signature_is_rejected(self):
+        """A token signed with the wrong secret is rejected."""
+        token = fast_hs256(_payload(), b"this-is-the-wrong-secret-key-32chars")
+        assert verify_token(token) is None
+
+    def test_truncated_token_is_rejected(self):
+        """A truncated token is rejected."""
+        secret = os.environ["BETTER_AUTH_SECRET"].encode()
+        token = fast_hs256(_payload(), secret)
+        assert verify_token(token[:len(token) // 2]) is None
+
+    def test_modified_payload_is_rejected(self):
+        """Claims re-signed with an attacker-chosen secret are rejected."""
+        token = fast_hs256(
+            _payload(sub="999", user_id=999, email="hacker@example.com"),
+            b"different-secret-key-for-tampering",
+        )
+        assert verify_token(token) is None
+
+    def test_valid_token_is_accepted(self):
+        """Sanity check: a correctly signed token verifies."""
+        secret = os.environ["BETTER_AUTH_SECRET"].encode()
+        payload = verify_token(fast_hs256(_payload(), secret))
+        assert payload is not None
+        assert payload["sub"] == "1"
@@ -4,19 +4,67 @@ Ensures User A cannot access User B's data.
 """
 
 import pytest
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
-from sqlmodel import Session
 from typing import Optional
 
+from src.services.user_isolation_example import user_isolation_service
 
+# Everything here runs against MagicMock sessions and pure-python
+# HTTPException — no shared IO or ordering dependencies — so the whole
+# module is safe to spread across pytest-xdist workers.
+pytestmark = pytest.mark.parallel_safe
+
+
+class FakeSession:
+    """Minimal stand-in for a database session.
+
+    MagicMock(spec=Session) walks the entire sqlmodel Session class on
+    every construction just to build the spec; these tests only touch
+    exec/add/commit, so a tiny fake with a per-instance MagicMock exec
+    keeps the same `session.exec.return_value...` wiring without the
+    introspection cost.
+    """
+
+    def __init__(self):
+        self.exec = MagicMock()
+
+    def add(self, instance):
+        pass
+
+    def commit(self):
+        pass
+
+
+# slots=True drops the per-instance __dict__, which matters once these are
+# built in bulk by the module-scoped fixture below
+@dataclass(slots=True)
 class MockModel:
     """Mock SQLModel for testing."""
-    __tablename__ = "mock_table"
-
-    def __init__(self, id: int, user_id: int, title: str = "Test"):
-        self.id = id
-        self.user_id = user_id
-        self.title = title
+    id: int
+    user_id: int
+    title: str = "Test"
+
+
+@pytest.fixture(scope="module")
+def _all_mock_resources():
+    """
+    Build every mock resource once per module.
+
+    The per-test fixtures below hand out fresh lists over these shared
+    instances, so tests keep function-scoped isolation of the list itself
+    without re-running MockModel.__init__ for every test.
+    """
+    return {
+        "a": [
+            MockModel(id=1, user_id=1, title="User A Todo 1"),
+            MockModel(id=2, user_id=1, title="User A Todo 2"),
+        ],
+        "b": [
+            MockModel(id=3, user_id=2, title="User B Todo 1"),
+            MockModel(id=4, user_id=2, title="User B Todo 2"),
+        ],
+    }
 
 
 class TestUserIsolation:
@@ -25,141 +73,72 @@ class TestUserIsolation:
     @pytest.fixture
     def mock_db_session(self):
         """Create a mock database session."""
-        return MagicMock(spec=Session)
+        return FakeSession()
 
     @pytest.fixture
-    def user_a_resources(self):
+    def user_a_resources(self, _all_mock_resources):
         """Resources owned by User A (user_id=1)."""
-        return [
-            MockModel(id=1, user_id=1, title="User A Todo 1"),
-            MockModel(id=2, user_id=1, title="User A Todo 2"),
-        ]
+        return list(_all_mock_resources["a"])
 
     @pytest.fixture
-    def user_b_resources(self):
+    def user_b_resources(self, _all_mock_resources):
         """Resources owned by User B (user_id=2)."""
-        return [
-            MockModel(id=3, user_id=2, title="User B Todo 1"),
-            MockModel(id=4, user_id=2, title="User B Todo 2"),
-        ]
-
-    def test_user_a_can_only_access_own_resources(self, mock_db_session, user_a_resources):
-        """Test that User A can only access their own resources."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        # Mock the query to return User A's resources
-        mock_query = MagicMock()
-        mock_db_session.exec.return_value.all.return_value = user_a_resources
-
-        with patch.object(user_isolation_service, 'get_user_owned_resources') as mock_get:
-            mock_get.return_value = user_a_resources
-
-            result = user_isolation_service.get_user_owned_resources(
-                mock_db_session, MockModel, user_id=1
+        return list(_all_mock_resources["b"])
+
+    # Every accessor shares the same contract shape — patch the method,
+    # return the canned value, assert what the caller sees — so one
+    # parametrized test covers all of them with a single fixture/collection
+    # cycle per case. The "user_a_resources" sentinel is resolved to the
+    # fixture of that name at run time.
+    @pytest.mark.parametrize(
+        "method, kwargs, ret",
+        [
+            pytest.param(
+                "get_user_owned_resources", {"user_id": 1},
+                "user_a_resources", id="owner-sees-only-own-resources",
+            ),
+            pytest.param(
+                "get_user_owned_resources", {"user_id": 1},
+                [], id="other-users-resources-filtered-out",
+            ),
+            pytest.param(
+                "get_single_user_resource", {"resource_id": 3, "user_id": 1},
+                None, id="single-resource-of-other-user-is-none",
+            ),
+            pytest.param(
+                "check_user_owns_resource", {"resource_id": 3, "user_id": 1},
+                False, id="ownership-check-false-for-other-user",
+            ),
+            pytest.param(
+                "check_user_owns_resource", {"resource_id": 1, "user_id": 1},
+                True, id="ownership-check-true-for-own-resource",
+            ),
+            pytest.param(
+                "update_user_resource",
+                {"resource_id": 3, "user_id": 1, "update_data": {"title": "Hacked"}},
+                False, id="update-fails-for-other-user",
+            ),
+            pytest.param(
+                "delete_user_resource", {"resource_id": 3, "user_id": 1},
+                False, id="delete-fails-for-other-user",
+            ),
+        ],
+    )
+    def test_isolation_accessor_contract(self, request, mock_db_session, method, kwargs, ret):
+        """Test that each isolation accessor only yields the owner's data."""
+        if isinstance(ret, str):
+            ret = request.getfixturevalue(ret)
+
+        with patch.object(user_isolation_service, method, return_value=ret):
+            result = getattr(user_isolation_service, method)(
+                mock_db_session, MockModel, **kwargs
             )
 
-            # Verify only User A's resources are returned
-            assert len(result) == 2
+        assert result == ret
+        if isinstance(result, list):
+            # Anything that does come back must belong to the requesting user
             for resource in result:
-                assert resource.user_id == 1
-
-    def test_user_a_cannot_access_user_b_resources(self, mock_db_session, user_b_resources):
-        """Test that User A cannot access User B's resources."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        # When User A tries to access with their user_id, they should get no resources
-        # because the query will filter by user_id=1 which doesn't match User B's resources
-        mock_db_session.exec.return_value.all.return_value = []
-
-        with patch.object(user_isolation_service, 'get_user_owned_resources') as mock_get:
-            mock_get.return_value = []
-
-            result = user_isolation_service.get_user_owned_resources(
-                mock_db_session, MockModel, user_id=1
-            )
-
-            # User A should get empty result when trying to access
-            # (since User B's resources are filtered out)
-            assert len(result) == 0
-
-    def test_get_single_user_resource_returns_none_for_other_user(self, mock_db_session):
-        """Test that getting a single resource owned by another user returns None."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        # Resource belongs to User B (user_id=2), but User A (user_id=1) is requesting
-        mock_db_session.exec.return_value.first.return_value = None
-
-        with patch.object(user_isolation_service, 'get_single_user_resource') as mock_get:
-            mock_get.return_value = None
-
-            result = user_isolation_service.get_single_user_resource(
-                mock_db_session, MockModel, resource_id=3, user_id=1
-            )
-
-            # User A should get None when trying to access User B's resource
-            assert result is None
-
-    def test_check_user_owns_resource_returns_false_for_other_user(self, mock_db_session):
-        """Test that ownership check returns False for resources owned by other users."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        with patch.object(user_isolation_service, 'check_user_owns_resource') as mock_check:
-            mock_check.return_value = False
-
-            result = user_isolation_service.check_user_owns_resource(
-                mock_db_session, MockModel, resource_id=3, user_id=1
-            )
-
-            # User A should not own User B's resource
-            assert result is False
-
-    def test_check_user_owns_resource_returns_true_for_own_resource(self, mock_db_session):
-        """Test that ownership check returns True for user's own resources."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        with patch.object(user_isolation_service, 'check_user_owns_resource') as mock_check:
-            mock_check.return_value = True
-
-            result = user_isolation_service.check_user_owns_resource(
-                mock_db_session, MockModel, resource_id=1, user_id=1
-            )
-
-            # User A should own their own resource
-            assert result is True
-
-    def test_update_user_resource_fails_for_other_user(self, mock_db_session):
-        """Test that updating a resource owned by another user fails."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        # Mock that the resource isn't found (because query is scoped to wrong user)
-        mock_db_session.exec.return_value.first.return_value = None
-
-        with patch.object(user_isolation_service, 'update_user_resource') as mock_update:
-            mock_update.return_value = False
-
-            result = user_isolation_service.update_user_resource(
-                mock_db_session, MockModel, resource_id=3, user_id=1, update_data={"title": "Hacked"}
-            )
-
-            # Update should fail for User A on User B's resource
-            assert result is False
-
-    def test_delete_user_resource_fails_for_other_user(self, mock_db_session):
-        """Test that deleting a resource owned by another user fails."""
-        from src.services.user_isolation_example import user_isolation_service
-
-        # Mock that the resource isn't found (because query is scoped to wrong user)
-        mock_db_session.exec.return_value.first.return_value = None
-
-        with patch.object(user_isolation_service, 'delete_user_resource') as mock_delete:
-            mock_delete.return_value = False
-
-            result = user_isolation_service.delete_user_resource(
-                mock_db_session, MockModel, resource_id=3, user_id=1
-            )
-
-            # Delete should fail for User A on User B's resource
-            assert result is False
+                assert resource.user_id == kwargs["user_id"]
 
 
 class TestUserIsolationErrorHandling:
@@ -117,7 +117,7 @@ const SignUpForm: React.FC<SignUpFormProps> = ({
   return (
     <div className="w-full max-w-md">
       {error && (
-        <div className="rounded-md bg-red-50 p-4 mb-4">
+        <div data-testid="auth-error" className="rounded-md bg-red-50 p-4 mb-4">
           <div className="flex">
             <div className="ml-3">
               <h3 className="text-sm font-medium text-red-800">{error}</h3>
@@ -4,57 +4,102 @@ These tests simulate user interactions with the sign-in form components.
 """
 
 import pytest
-from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 import time
-import os
 
+# All tests drive the single session-scoped browser, so they must stay on
+# one worker and never interleave with other tests.
+pytestmark = pytest.mark.serial
 
-class TestSignInForm:
+# Stable hook on the auth error banner; a CSS selector avoids scanning
+# class attributes the way By.CLASS_NAME does.
+AUTH_ERROR = (By.CSS_SELECTOR, "[data-testid='auth-error']")
+
+
+def wait_for_auth_error(driver, timeout: int = 2):
+    """Wait until the auth error banner is actually visible (not just in the DOM).
+
+    The error renders client-side within a few hundred ms of the failed
+    submit, so a 2s cap keeps the failure penalty short without flaking.
     """
-    Test suite for the sign-in form component.
+    return WebDriverWait(driver, timeout).until(
+        EC.visibility_of_element_located(AUTH_ERROR)
+    )
+
+
+def wait_for_url_contains(driver, fragment, timeout: int = 5):
+    """Wait for a client-side navigation with a 50ms poll.
+
+    WebDriverWait's default 500ms poll wastes ~250ms on average after the
+    redirect has already happened; checking current_url is a cheap driver
+    round-trip, so polling 10x faster costs nothing noticeable.
     """
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: fragment in d.current_url
+    )
+
+
+def _ensure_on_page(driver, url):
+    """Navigate to url, or just reset the form if the page is already loaded.
 
-    @classmethod
-    def setup_class(cls):
-        """Set up the test environment."""
-        # Use Chrome driver (make sure chromedriver is in PATH)
-        cls.driver = webdriver.Chrome()
-        cls.wait = WebDriverWait(cls.driver, 10)
+    A full driver.get() pays a Next.js page load; consecutive tests on the
+    same form only need the fields cleared. clear() goes through WebDriver
+    input events, so the React-controlled state resets too (assigning
+    .value = '' via JS would leave the component state stale).
+
+    A previous test may have left the auth error banner mounted; the input
+    events from clear() dismiss it (the forms reset the error on change),
+    but if it lingers we fall back to a reload — a stale banner must never
+    be around to satisfy the next test's error wait.
+    """
+    if driver.current_url.rstrip("/") == url.rstrip("/"):
+        for field in driver.find_elements(By.CSS_SELECTOR, "form input:not([type=hidden])"):
+            field.clear()
+        if driver.find_elements(*AUTH_ERROR):
+            try:
+                WebDriverWait(driver, 2).until(
+                    EC.invisibility_of_element_located(AUTH_ERROR)
+                )
+            except TimeoutException:
+                driver.get(url)
+    else:
+        driver.get(url)
 
-        # Get the base URL from environment or use default
-        cls.base_url = os.getenv('NEXTJS_TEST_URL', 'http://localhost:3000')
 
-    @classmethod
-    def teardown_class(cls):
-        """Clean up after tests."""
-        cls.driver.quit()
+class TestSignInForm:
+    """
+    Test suite for the sign-in form component.
+    """
 
-    def setup_method(self):
-        """Set up before each test method."""
-        # Navigate to the sign-in page
-        self.driver.get(f"{self.base_url}/auth/sign-in")
+    @pytest.fixture(autouse=True)
+    def setup(self, clean_driver, wait, base_url):
+        """Bind the shared session driver and navigate to the sign-in page."""
+        self.driver = clean_driver
+        self.wait = wait
+        self.base_url = base_url
+        _ensure_on_page(self.driver, f"{self.base_url}/auth/sign-in")
 
     def test_render_signin_form(self):
         """Test that the sign-in form renders correctly."""
         # Wait for the email input field to be present
-        email_input = self.wait.until(
+        self.wait.until(
             EC.presence_of_element_located((By.NAME, "email"))
         )
 
-        # Verify the email input field exists
-        assert email_input is not None
-
-        # Verify the password input field exists
-        password_input = self.driver.find_element(By.NAME, "password")
-        assert password_input is not None
-
-        # Verify the submit button exists
-        submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-        assert submit_button is not None
+        # Check the remaining elements in one WebDriver round-trip instead
+        # of a find_element call (and protocol hop) per element
+        present = self.driver.execute_script(
+            "return {"
+            "email: !!document.querySelector('[name=email]'),"
+            "password: !!document.querySelector('[name=password]'),"
+            "submit: !!document.querySelector('button[type=submit]')"
+            "}"
+        )
+        assert all(present.values()), f"missing form elements: {present}"
 
     def test_signin_with_valid_credentials(self):
         """Test signing in with valid credentials."""
@@ -75,51 +120,43 @@ class TestSignInForm:
         submit_button.click()
 
         # Wait for redirect to dashboard or home page
-        self.wait.until(EC.url_contains("/dashboard"))
+        wait_for_url_contains(self.driver, "/dashboard")
 
         # Verify that the user is redirected to the correct page
         assert "/dashboard" in self.driver.current_url
 
-    def test_signin_with_invalid_credentials(self):
-        """Test signing in with invalid credentials."""
+    # The negative paths share one flow (fill, submit, expect the error
+    # banner); parametrizing them lets consecutive cases reuse the already
+    # loaded page — setup only clears the fields between them.
+    @pytest.mark.parametrize(
+        "email, password",
+        [
+            pytest.param("invalid@example.com", "wrongpassword", id="invalid-credentials"),
+            pytest.param("", "", id="missing-fields"),
+        ],
+    )
+    def test_signin_error_paths(self, email, password):
+        """Test that failed sign-in attempts display an error message."""
         # Wait for the email input field to be present
         email_input = self.wait.until(
             EC.presence_of_element_located((By.NAME, "email"))
         )
 
-        # Enter invalid email
-        email_input.send_keys("invalid@example.com")
+        # Setup guarantees no banner survived the previous case, so the
+        # error wait below can only be satisfied by a fresh render
+        assert not self.driver.find_elements(*AUTH_ERROR)
 
-        # Enter invalid password
-        password_input = self.driver.find_element(By.NAME, "password")
-        password_input.send_keys("wrongpassword")
+        if email:
+            email_input.send_keys(email)
+        if password:
+            self.driver.find_element(By.NAME, "password").send_keys(password)
 
         # Submit the form
         submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
         submit_button.click()
 
-        # Wait for error message to appear
-        error_message = self.wait.until(
-            EC.presence_of_element_located((By.CLASS_NAME, "text-red-800"))
-        )
-
-        # Verify that an error message is displayed
-        assert error_message.text != ""
-
-    def test_signin_with_missing_fields(self):
-        """Test signing in with missing required fields."""
-        # Wait for the submit button to be present
-        submit_button = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']"))
-        )
-
-        # Try to submit without entering email or password
-        submit_button.click()
-
-        # Wait for error message to appear
-        error_message = self.wait.until(
-            EC.presence_of_element_located((By.CLASS_NAME, "text-red-800"))
-        )
+        # Wait for the error banner to become visible
+        error_message = wait_for_auth_error(self.driver)
 
         # Verify that an error message is displayed
         assert error_message.text != ""
@@ -135,7 +172,7 @@ class TestSignInForm:
         signup_link.click()
 
         # Wait for navigation to sign-up page
-        self.wait.until(EC.url_contains("/auth/sign-up"))
+        wait_for_url_contains(self.driver, "/auth/sign-up")
 
         # Verify that the user is on the sign-up page
         assert "/auth/sign-up" in self.driver.current_url
@@ -146,47 +183,32 @@ class TestSignUpForm:
     Test suite for the sign-up form component.
     """
 
-    @classmethod
-    def setup_class(cls):
-        """Set up the test environment."""
-        # Use Chrome driver (make sure chromedriver is in PATH)
-        cls.driver = webdriver.Chrome()
-        cls.wait = WebDriverWait(cls.driver, 10)
-
-        # Get the base URL from environment or use default
-        cls.base_url = os.getenv('NEXTJS_TEST_URL', 'http://localhost:3000')
-
-    @classmethod
-    def teardown_class(cls):
-        """Clean up after tests."""
-        cls.driver.quit()
-
-    def setup_method(self):
-        """Set up before each test method."""
-        # Navigate to the sign-up page
-        self.driver.get(f"{self.base_url}/auth/sign-up")
+    @pytest.fixture(autouse=True)
+    def setup(self, clean_driver, wait, base_url):
+        """Bind the shared session driver and navigate to the sign-up page."""
+        self.driver = clean_driver
+        self.wait = wait
+        self.base_url = base_url
+        _ensure_on_page(self.driver, f"{self.base_url}/auth/sign-up")
 
     def test_render_signup_form(self):
         """Test that the sign-up form renders correctly."""
         # Wait for the email input field to be present
-        email_input = self.wait.until(
+        self.wait.until(
             EC.presence_of_element_located((By.NAME, "email"))
         )
 
-        # Verify the email input field exists
-        assert email_input is not None
-
-        # Verify the password input field exists
-        password_input = self.driver.find_element(By.NAME, "password")
-        assert password_input is not None
-
-        # Verify the confirm password input field exists
-        confirm_password_input = self.driver.find_element(By.NAME, "confirmPassword")
-        assert confirm_password_input is not None
-
-        # Verify the submit button exists
-        submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-        assert submit_button is not None
+        # Check the remaining elements in one WebDriver round-trip instead
+        # of a find_element call (and protocol hop) per element
+        present = self.driver.execute_script(
+            "return {"
+            "email: !!document.querySelector('[name=email]'),"
+            "password: !!document.querySelector('[name=password]'),"
+            "confirmPassword: !!document.querySelector('[name=confirmPassword]'),"
+            "submit: !!document.querySelector('button[type=submit]')"
+            "}"
+        )
+        assert all(present.values()), f"missing form elements: {present}"
 
     def test_signup_with_valid_credentials(self):
         """Test signing up with valid credentials."""
@@ -211,7 +233,7 @@ class TestSignUpForm:
         submit_button.click()
 
         # Wait for redirect to dashboard or home page
-        self.wait.until(EC.url_contains("/dashboard"))
+        wait_for_url_contains(self.driver, "/dashboard")
 
         # Verify that the user is redirected to the correct page
         assert "/dashboard" in self.driver.current_url
@@ -238,14 +260,32 @@ class TestSignUpForm:
         submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
         submit_button.click()
 
-        # Wait for error message to appear
-        error_message = self.wait.until(
-            EC.presence_of_element_located((By.CLASS_NAME, "text-red-800"))
-        )
+        # Wait for the error banner to become visible
+        error_message = wait_for_auth_error(self.driver)
 
         # Verify that an error message about password mismatch is displayed
         assert "match" in error_message.text.lower()
 
 
+class TestAuthenticatedDashboard:
+    """
+    Authenticated flows that skip the sign-in form.
+
+    These use the authenticated_driver fixture: the JWT comes from one
+    API login per session and is injected into localStorage, so reaching
+    an authenticated page costs milliseconds instead of a form round-trip.
+    """
+
+    def test_dashboard_accessible_with_injected_token(self, authenticated_driver):
+        """Test that an API-obtained token grants access to the dashboard."""
+        # The auth guard runs client-side; wait for the URL to settle on
+        # the dashboard rather than sleeping a fixed beat — a rejected
+        # token redirects to /auth/sign-in and the wait times out instead.
+        wait_for_url_contains(authenticated_driver, "/dashboard")
+
+        assert "/auth/sign-in" not in authenticated_driver.current_url
+        assert "/dashboard" in authenticated_driver.current_url
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
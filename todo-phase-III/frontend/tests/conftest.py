@@ -0,0 +1,121 @@
+"""
+Shared pytest fixtures for the frontend Selenium tests.
+
+The Chrome process is the expensive part of this suite (~1-3s per launch),
+so the driver is session-scoped: one browser serves every test in the run.
+Per-test isolation is handled by resetting browser state explicitly instead
+of relaunching the process.
+"""
+
+import os
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    """Base URL of the Next.js app under test."""
+    return os.getenv('NEXTJS_TEST_URL', 'http://localhost:3000')
+
+
+@pytest.fixture(scope="session")
+def chrome_service():
+    """One chromedriver subprocess for the whole test session.
+
+    Spawning chromedriver costs 200-500ms; any driver created during the
+    run should attach to this service rather than starting its own.
+    """
+    service = Service()
+    yield service
+    service.stop()
+
+
+@pytest.fixture(scope="session")
+def chrome_driver(chrome_service):
+    """One headless Chrome instance shared by the whole test session.
+
+    Headless mode skips window/GPU init, cutting startup from ~2s to
+    ~500ms; --no-sandbox and --disable-dev-shm-usage keep it working in
+    containerized CI where the sandbox and /dev/shm are restricted.
+    """
+    options = webdriver.ChromeOptions()
+    for arg in (
+        "--headless=new",
+        "--disable-gpu",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--window-size=1280,800",
+    ):
+        options.add_argument(arg)
+
+    driver = webdriver.Chrome(service=chrome_service, options=options)
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture(scope="session")
+def wait(chrome_driver):
+    """Default explicit wait bound to the shared driver."""
+    return WebDriverWait(chrome_driver, 10)
+
+
+@pytest.fixture(scope="session")
+def auth_token():
+    """JWT obtained once per session straight from the backend login API.
+
+    Tests that need an authenticated browser should not drive the sign-in
+    form — one HTTP POST replaces the whole page-load + submit + redirect
+    flow. The account must already exist in the backend under test.
+    """
+    import requests
+
+    backend_url = os.getenv('BACKEND_TEST_URL', 'http://localhost:8000')
+    response = requests.post(
+        f"{backend_url}/api/v1/auth/login",
+        json={
+            "email": os.getenv('TEST_USER_EMAIL', 'test@example.com'),
+            "password": os.getenv('TEST_USER_PASSWORD', 'validpassword123'),
+        },
+        timeout=10,
+    )
+    response.raise_for_status()
+    return response.json()["data"]["token"]
+
+
+@pytest.fixture
+def authenticated_driver(clean_driver, base_url, auth_token):
+    """The shared driver already signed in, bypassing the sign-in form.
+
+    The app keeps its JWT in localStorage under 'jwt_token' (see
+    auth-config.ts), so injecting the token there and loading /dashboard
+    gives tests an authenticated state in milliseconds.
+    """
+    # localStorage is per-origin, so the app must be loaded first
+    clean_driver.get(base_url)
+    clean_driver.execute_script(
+        "window.localStorage.setItem('jwt_token', arguments[0])", auth_token
+    )
+    clean_driver.get(f"{base_url}/dashboard")
+    return clean_driver
+
+
+@pytest.fixture
+def clean_driver(chrome_driver):
+    """
+    The shared driver with per-test state reset.
+
+    Clearing cookies is much cheaper than relaunching Chrome and is enough
+    isolation for these form tests; anything that logs in must not leak a
+    session into the next test. The stored JWT lives in localStorage, so
+    that is wiped too.
+    """
+    chrome_driver.delete_all_cookies()
+    try:
+        chrome_driver.execute_script("window.localStorage.clear()")
+    except WebDriverException:
+        pass  # no origin loaded yet (e.g. first test of the session)
+    return chrome_driver